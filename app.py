@@ -1,38 +1,123 @@
 import sqlite3
 import json
 import os
-from flask import Flask, render_template, g, jsonify, request, redirect, url_for, flash, abort
+import queue
+import threading
+import time
+import itertools
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from flask import Flask, render_template, g, jsonify, request, redirect, url_for, flash, abort, Response
 from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
 from flask_bcrypt import Bcrypt
+from flask_caching import Cache
+from jinja2 import FileSystemBytecodeCache
 from flask_wtf import FlaskForm
 from wtforms import StringField, PasswordField, SubmitField, TextAreaField, DateField, IntegerField
-from wtforms.validators import DataRequired, Email, EqualTo, ValidationError, Length, NumberRange
+from wtforms.validators import DataRequired, Email, EqualTo, Length, NumberRange
 import datetime
 
+try:
+    import ijson  # Optional: streams the seed JSON instead of loading it whole
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # Optional: faster JSON for the autocomplete body and the seed files
+except ImportError:
+    orjson = None
+
 # --- App Setup ---
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'a_very_secret_key_for_local_use_only' # Change this
 DATABASE = 'kannada_letterboxd.db' # Renamed DB for clarity
+app.config['BCRYPT_LOG_ROUNDS'] = int(os.getenv('BCRYPT_ROUNDS', '12')) # Lower (e.g. 10) for faster local dev
+
+def dumps_bytes(obj):
+    """Serializes obj to UTF-8 JSON bytes, with orjson when it's installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
 
 # --- Utility Setup ---
 bcrypt = Bcrypt(app)
+
+@functools.lru_cache(maxsize=None)
+def dummy_password_hash():
+    """Checked against when a login email is unknown, so that case costs the same bcrypt time as a
+    wrong password. Hashed on first use, so startup and the CLI commands don't pay for it."""
+    return bcrypt.generate_password_hash(os.urandom(16).hex()).decode('utf-8')
+
 login_manager = LoginManager(app)
 login_manager.login_view = 'login' # Page to redirect to if user is not logged in
 login_manager.login_message_category = 'info'
+cache = Cache(app, config={'CACHE_TYPE': 'SimpleCache'})
+# Compiled templates are kept on disk so a fresh worker doesn't re-parse them
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
 
 # --- Database Setup ---
+# Connections are kept open and reused across requests so each request gets a warm
+# page cache instead of reopening the file. WAL lets readers run alongside a writer.
+DB_POOL_SIZE = 8
+DB_OPTIMIZE_EVERY = 1000  # Releases between PRAGMA optimize runs
+_pool = queue.Queue(maxsize=DB_POOL_SIZE)
+_releases = itertools.count(1)
+# SQLite allows one writer at a time; queueing on this lock is cheaper than pooled
+# connections colliding and spinning in the busy handler. WAL readers never take it.
+_WRITE_LOCK = threading.Lock()
+
+def connect_db():
+    db = sqlite3.connect(DATABASE, check_same_thread=False)
+    db.row_factory = sqlite3.Row
+    db.execute('PRAGMA journal_mode=WAL')
+    db.execute('PRAGMA synchronous=NORMAL')
+    db.execute('PRAGMA cache_size=-64000')  # 64 MB
+    db.execute('PRAGMA temp_store=MEMORY')
+    db.execute('PRAGMA mmap_size=268435456')  # 256 MB
+    db.execute('PRAGMA analysis_limit=400')  # Keeps the ANALYZE behind PRAGMA optimize short
+    return db
+
+def borrow_db():
+    try:
+        return _pool.get_nowait()
+    except queue.Empty:
+        return connect_db()
+
+def optimize_db(db):
+    """Best-effort PRAGMA optimize. It may ANALYZE, which needs the write lock, so when a
+    writer is busy this round is skipped rather than failing the request that released db."""
+    if not _WRITE_LOCK.acquire(blocking=False):
+        return
+    try:
+        db.execute('PRAGMA optimize')
+    except sqlite3.OperationalError:
+        pass  # Locked by another process; a later round will catch up
+    finally:
+        _WRITE_LOCK.release()
+
+def release_db(db):
+    db.rollback()  # Never hand an open transaction to the next user
+    # Long-lived connections never hit the usual "optimize before close", so refresh
+    # the query planner's statistics every so often instead
+    if next(_releases) % DB_OPTIMIZE_EVERY == 0:
+        optimize_db(db)
+    try:
+        _pool.put_nowait(db)
+    except queue.Full:
+        optimize_db(db)
+        db.close()
+
 def get_db():
     db = getattr(g, '_database', None)
     if db is None:
-        db = g._database = sqlite3.connect(DATABASE)
-        db.row_factory = sqlite3.Row
+        db = g._database = borrow_db()
     return db
 
 @app.teardown_appcontext
 def close_connection(exception):
-    db = getattr(g, '_database', None)
+    db = g.pop('_database', None)
     if db is not None:
-        db.close()
+        release_db(db)
 
 def init_db():
     with app.app_context():
@@ -43,34 +128,55 @@ def init_db():
         print("Initialized the database.")
         populate_db() # Populate with our author/work data
 
-def get_or_create_author(db, name_kannada, name_english, biography, era, image_url):
-    """Checks if author exists. If not, inserts and returns ID. Prevents duplicates."""
-    existing = db.execute('SELECT author_id FROM Author WHERE name_english = ?', (name_english,)).fetchone()
-    if existing:
-        return existing['author_id']
-    
-    db.execute('INSERT INTO Author (name_kannada, name_english, biography, era, image_url) VALUES (?, ?, ?, ?, ?)',
-               (name_kannada, name_english, biography, era, image_url))
-    return db.execute("SELECT last_insert_rowid()").fetchone()[0]
+# Seed data fix-ups, keyed by the name used in the JSON files
+_KANNADA_NAMES_WRITER = {
+    'Kuvempu': 'ಕುವೆಂಪು',
+    'U. R. Ananthamurthy': 'ಯು.ಆರ್. ಅನಂತಮೂರ್ತಿ',
+    'S. L. Bhyrappa': 'ಎಸ್.ಎಲ್. ಭೈರಪ್ಪ',
+    'Poornachandra Tejaswi': 'ಪೂರ್ಣಚಂದ್ರ ತೇಜಸ್ವಿ',
+    'Graama Seva Bhaagya (Bevina Seena Sharief)': 'ಬೆವಿನ ಸೀನ ಶರೀಫ್',
+}
+_KANNADA_NAMES_POET = {
+    'D. R. Bendre': 'ಡಿ. ಆರ್. ಬೇಂದ್ರೆ',
+    'Masti Venkatesha Iyengar': 'ಮಾಸ್ತಿ ವೆಂಕಟೇಶ ಅಯ್ಯಂಗಾರ್',
+    'K. S. Narasimhaswamy': 'ಕೆ. ಎಸ್. ನರಸಿಂಹಸ್ವಾಮಿ',
+    'G. S. Shivarudrappa': 'ಜಿ. ಎಸ್. ಶಿವರುದ್ರಪ್ಪ',
+}
+_WRITER_NAME_OVERRIDES = {
+    'Graama Seva Bhaagya (Bevina Seena Sharief)': 'Bevina Seena Sharief',  # Use simpler name
+}
+_IMAGE_OVERRIDES = {  # Writers whose portraits in static/images don't follow the name_slug.jpg pattern
+    'Kuvempu': 'kuvempu.jpeg',
+    'Poornachandra Tejaswi': 'tejaswi.jpeg',
+}
+_SLUG_TABLE = str.maketrans(' ', '_', '.')  # 'U. R. Ananthamurthy' -> 'u_r_ananthamurthy'
+
+def iter_json_records(path):
+    """Yields each record of a JSON array file, streaming with ijson when it's installed."""
+    with open(path, 'rb') as f:
+        if ijson is not None:
+            yield from ijson.items(f, 'item')
+        elif orjson is not None:
+            yield from orjson.loads(f.read())
+        else:
+            yield from json.load(f)
 
 def populate_db():
     db = get_db()
     
-    # Load data from JSON files
+    # Load data from JSON files (records are streamed, not held in memory as a whole list)
     writers_data = []
     poets_data = []
     
     # Load writers JSON
     writers_path = os.path.join(os.path.dirname(__file__), 'databases', 'writer.json')
     if os.path.exists(writers_path):
-        with open(writers_path, 'r', encoding='utf-8') as f:
-            writers_data = json.load(f)
+        writers_data = iter_json_records(writers_path)
     
     # Load poets JSON
     poets_path = os.path.join(os.path.dirname(__file__), 'databases', 'poets.json')
     if os.path.exists(poets_path):
-        with open(poets_path, 'r', encoding='utf-8') as f:
-            poets_data = json.load(f)
+        poets_data = iter_json_records(poets_path)
     
     # Combine and process all authors
     all_authors = {}
@@ -80,20 +186,9 @@ def populate_db():
         name = writer.get('name', '')
         # Skip if already processed (Kuvempu appears in both)
         if name not in all_authors:
-            # Get Kannada name - use name field as fallback
-            name_kannada = name  # Will use English name if Kannada not available
-            # Try to get Kannada name from existing data or use English
-            if name == 'Kuvempu':
-                name_kannada = 'ಕುವೆಂಪು'
-            elif name == 'U. R. Ananthamurthy':
-                name_kannada = 'ಯು.ಆರ್. ಅನಂತಮೂರ್ತಿ'
-            elif name == 'S. L. Bhyrappa':
-                name_kannada = 'ಎಸ್.ಎಲ್. ಭೈರಪ್ಪ'
-            elif name == 'Poornachandra Tejaswi':
-                name_kannada = 'ಪೂರ್ಣಚಂದ್ರ ತೇಜಸ್ವಿ'
-            elif name == 'Graama Seva Bhaagya (Bevina Seena Sharief)':
-                name_kannada = 'ಬೆವಿನ ಸೀನ ಶರೀಫ್'
-                name = 'Bevina Seena Sharief'  # Use simpler name
+            # Get Kannada name - will use English name if Kannada not available
+            name_kannada = _KANNADA_NAMES_WRITER.get(name, name)
+            name = _WRITER_NAME_OVERRIDES.get(name, name)
             
             biography = writer.get('biography', writer.get('contribution', ''))
             era = 'Modern'  # Default era
@@ -103,11 +198,7 @@ def populate_db():
                 era = 'Navodaya'
             
             # Determine image URL
-            image_url = f"{name.lower().replace(' ', '_').replace('.', '')}.jpg"
-            if name == 'Kuvempu':
-                image_url = 'kuvempu.jpeg'
-            elif name == 'Poornachandra Tejaswi':
-                image_url = 'tejaswi.jpeg'
+            image_url = _IMAGE_OVERRIDES.get(name) or name.lower().translate(_SLUG_TABLE) + '.jpg'
             
             all_authors[name] = {
                 'name_kannada': name_kannada,
@@ -131,15 +222,7 @@ def populate_db():
             continue
         
         # Get Kannada name
-        name_kannada = name
-        if name == 'D. R. Bendre':
-            name_kannada = 'ಡಿ. ಆರ್. ಬೇಂದ್ರೆ'
-        elif name == 'Masti Venkatesha Iyengar':
-            name_kannada = 'ಮಾಸ್ತಿ ವೆಂಕಟೇಶ ಅಯ್ಯಂಗಾರ್'
-        elif name == 'K. S. Narasimhaswamy':
-            name_kannada = 'ಕೆ. ಎಸ್. ನರಸಿಂಹಸ್ವಾಮಿ'
-        elif name == 'G. S. Shivarudrappa':
-            name_kannada = 'ಜಿ. ಎಸ್. ಶಿವರುದ್ರಪ್ಪ'
+        name_kannada = _KANNADA_NAMES_POET.get(name, name)
         
         biography = poet.get('biography', poet.get('contribution', ''))
         era = 'Modern'
@@ -147,7 +230,7 @@ def populate_db():
             era = 'Navodaya'
         
         # Determine image URL
-        image_url = f"{name.lower().replace(' ', '_').replace('.', '')}.jpg"
+        image_url = name.lower().translate(_SLUG_TABLE) + '.jpg'
         
         all_authors[name] = {
             'name_kannada': name_kannada,
@@ -161,48 +244,43 @@ def populate_db():
             'type': 'Poet'
         }
     
-    # Insert authors and get IDs
-    author_ids = {}
-    for author_name, author_info in all_authors.items():
-        author_ids[author_name] = get_or_create_author(
-            db, 
-            author_info['name_kannada'],
-            author_info['name_english'],
-            author_info['biography'],
-            author_info['era'],
-            author_info['image_url']
-        )
-    
-    # Insert works
-    works_count = 0
+    # Everything below is written in a single transaction with batched inserts
+    db.execute('BEGIN')
+    
+    # Insert authors, then resolve all their IDs with one query. Author.name_english and
+    # Work.title_english are unique (case-insensitively), so SQLite itself skips duplicates.
+    db.executemany('INSERT OR IGNORE INTO Author (name_kannada, name_english, biography, era, image_url) VALUES (?, ?, ?, ?, ?)',
+                   [(author_info['name_kannada'], author_info['name_english'], author_info['biography'],
+                     author_info['era'], author_info['image_url']) for author_info in all_authors.values()])
+    author_ids = {row['name_english'].lower(): row['author_id']
+                  for row in db.execute('SELECT author_id, name_english FROM Author')}
+    
+    # Collect works; a title listed more than once is only inserted for its first author
+    work_rows = []
     for author_name, author_info in all_authors.items():
-        author_id = author_ids[author_name]
+        author_id = author_ids[author_name.lower()]
+        genres = set(author_info.get('genres', []))  # Looked up once per work below
         
         # Add famous works (novels, stories, etc.)
         for work_title in author_info.get('famous_works', []):
-            # Check if work already exists
-            existing_work = db.execute('SELECT work_id FROM Work WHERE title_english = ?', (work_title,)).fetchone()
-            if not existing_work:
-                # Determine work type
-                work_type = 'Novel'
-                if 'Play' in work_title or 'Drama' in author_info.get('genres', []):
-                    work_type = 'Play'
-                elif 'Short Stories' in author_info.get('genres', []):
-                    work_type = 'Short Story'
-                
-                # Use English title for Kannada title if not available
-                db.execute('INSERT INTO Work (author_id, title_kannada, title_english, type, synopsis) VALUES (?, ?, ?, ?, ?)',
-                          (author_id, work_title, work_title, work_type, f"A notable work by {author_info['name_english']}."))
-                works_count += 1
+            # Determine work type
+            work_type = 'Novel'
+            if 'Play' in work_title or 'Drama' in genres:
+                work_type = 'Play'
+            elif 'Short Stories' in genres:
+                work_type = 'Short Story'
+            
+            # Use English title for Kannada title if not available
+            work_rows.append((author_id, work_title, work_title, work_type,
+                              f"A notable work by {author_info['name_english']}."))
         
         # Add famous poems
         for poem_title in author_info.get('famous_poems', []):
-            # Check if work already exists
-            existing_work = db.execute('SELECT work_id FROM Work WHERE title_english = ?', (poem_title,)).fetchone()
-            if not existing_work:
-                db.execute('INSERT INTO Work (author_id, title_kannada, title_english, type, synopsis) VALUES (?, ?, ?, ?, ?)',
-                          (author_id, poem_title, poem_title, 'Poetry', f"A famous poem by {author_info['name_english']}."))
-                works_count += 1
+            work_rows.append((author_id, poem_title, poem_title, 'Poetry',
+                              f"A famous poem by {author_info['name_english']}."))
+    
+    works_count = db.executemany('INSERT OR IGNORE INTO Work (author_id, title_kannada, title_english, type, synopsis) VALUES (?, ?, ?, ?, ?)',
+                                 work_rows).rowcount
     
     db.commit()
     print(f"Populated the database with {len(all_authors)} authors and {works_count} works.")
@@ -225,9 +303,8 @@ def populate_reviews():
         if not user:
             # Create dummy user with hashed password
             hashed = bcrypt.generate_password_hash('dummy123').decode('utf-8')
-            db.execute('INSERT INTO User (username, email, password_hash) VALUES (?, ?, ?)',
-                      (username, f'{username.lower()}@example.com', hashed))
-            user_id = db.execute("SELECT last_insert_rowid()").fetchone()[0]
+            user_id = db.execute('INSERT INTO User (username, email, password_hash) VALUES (?, ?, ?)',
+                                 (username, f'{username.lower()}@example.com', hashed)).lastrowid
         else:
             user_id = user['user_id']
         dummy_users.append(user_id)
@@ -251,15 +328,14 @@ def populate_reviews():
         "A wonderful book that I couldn't put down."
     ]
     
-    # Populate reviews for each work
-    reviews_added = 0
+    # (user, work) pairs that already have a review, loaded once up front
+    reviewed = {(row['user_id'], row['work_id']) for row in db.execute('SELECT user_id, work_id FROM Review')}
+    
+    # Populate reviews for each work, collected and inserted as one batch
+    review_rows = []
     for work in works:
         work_id = work['work_id']
         
-        # Check existing reviews count
-        existing_count = db.execute('SELECT COUNT(*) as count FROM Review WHERE work_id = ?', 
-                                   (work_id,)).fetchone()['count']
-        
         # Add 3-8 reviews per work (to create variation in popularity)
         num_reviews = random.randint(3, 8)
         
@@ -268,10 +344,9 @@ def populate_reviews():
             user_id = random.choice(dummy_users)
             
             # Check if this user already reviewed this work
-            existing_review = db.execute('SELECT review_id FROM Review WHERE user_id = ? AND work_id = ?',
-                                        (user_id, work_id)).fetchone()
-            if existing_review:
+            if (user_id, work_id) in reviewed:
                 continue
+            reviewed.add((user_id, work_id))
             
             # Rating between 4 and 5 (using 4 or 5 since rating is INTEGER)
             rating = random.choice([4, 4, 4, 5, 5])  # More 4s and 5s
@@ -291,14 +366,14 @@ def populate_reviews():
             # to ensure reviews appear in "this week"
             date_logged = (datetime.datetime.now() - datetime.timedelta(days=days_ago)).isoformat()
             
-            db.execute('''
-                INSERT INTO Review (user_id, work_id, rating, review_text, date_read, date_logged)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (user_id, work_id, rating, review_text, date_read, date_logged))
-            reviews_added += 1
+            review_rows.append((user_id, work_id, rating, review_text, date_read, date_logged))
     
+    db.executemany('''
+        INSERT INTO Review (user_id, work_id, rating, review_text, date_read, date_logged)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''', review_rows)
     db.commit()
-    print(f"Populated {reviews_added} reviews for {len(works)} works.")
+    print(f"Populated {len(review_rows)} reviews for {len(works)} works.")
 
 @app.cli.command('init')
 def init_db_command():
@@ -313,6 +388,14 @@ def populate_reviews_command():
     populate_reviews()
     print('Reviews populated successfully.')
 
+@app.cli.command('warm-templates')
+def warm_templates_command():
+    """Command to precompile all templates into the bytecode cache: `flask warm-templates`"""
+    templates = app.jinja_env.list_templates()
+    for name in templates:
+        app.jinja_env.get_template(name)
+    print(f'Compiled {len(templates)} templates.')
+
 # --- User & Login Management ---
 class User(UserMixin):
     """User class for Flask-Login."""
@@ -327,7 +410,7 @@ class User(UserMixin):
 @login_manager.user_loader
 def load_user(user_id):
     db = get_db()
-    user_data = db.execute('SELECT * FROM User WHERE user_id = ?', (user_id,)).fetchone()
+    user_data = db.execute('SELECT user_id, username, email FROM User WHERE user_id = ?', (user_id,)).fetchone()
     if user_data:
         return User(user_data['user_id'], user_data['username'], user_data['email'])
     return None
@@ -340,18 +423,6 @@ class RegistrationForm(FlaskForm):
     confirm_password = PasswordField('Confirm Password', validators=[DataRequired(), EqualTo('password')])
     submit = SubmitField('Sign Up')
 
-    def validate_username(self, username):
-        db = get_db()
-        user = db.execute('SELECT * FROM User WHERE username = ?', (username.data,)).fetchone()
-        if user:
-            raise ValidationError('Username is already taken.')
-
-    def validate_email(self, email):
-        db = get_db()
-        user = db.execute('SELECT * FROM User WHERE email = ?', (email.data,)).fetchone()
-        if user:
-            raise ValidationError('Email is already registered.')
-
 class LoginForm(FlaskForm):
     email = StringField('Email', validators=[DataRequired(), Email()])
     password = PasswordField('Password', validators=[DataRequired()])
@@ -371,12 +442,25 @@ def register():
         return redirect(url_for('homepage'))
     form = RegistrationForm()
     if form.validate_on_submit():
-        hashed_password = bcrypt.generate_password_hash(form.password.data).decode('utf-8')
         db = get_db()
+        # One lookup covers both uniqueness checks, and runs before the (slow) password hash.
+        # The username and email may belong to different accounts, so each gets its own flag
+        taken = db.execute('''
+            SELECT MAX(username = ?) AS username_taken, MAX(email = ?) AS email_taken
+            FROM User WHERE username = ? OR email = ?
+        ''', (form.username.data, form.email.data, form.username.data, form.email.data)).fetchone()
+        if taken['username_taken']:
+            form.username.errors.append('Username is already taken.')
+        if taken['email_taken']:
+            form.email.errors.append('Email is already registered.')
+        if form.username.errors or form.email.errors:
+            return render_template('register.html', title='Register', form=form)
+        hashed_password = bcrypt.generate_password_hash(form.password.data).decode('utf-8')
         try:
-            db.execute('INSERT INTO User (username, email, password_hash) VALUES (?, ?, ?)',
-                       (form.username.data, form.email.data, hashed_password))
-            db.commit()
+            with _WRITE_LOCK:
+                db.execute('INSERT INTO User (username, email, password_hash) VALUES (?, ?, ?)',
+                           (form.username.data, form.email.data, hashed_password))
+                db.commit()
             flash('Your account has been created! You can now log in.', 'success')
             return redirect(url_for('login'))
         except sqlite3.IntegrityError:
@@ -392,7 +476,8 @@ def login():
     if form.validate_on_submit():
         db = get_db()
         user_data = db.execute('SELECT * FROM User WHERE email = ?', (form.email.data,)).fetchone()
-        if user_data and bcrypt.check_password_hash(user_data['password_hash'], form.password.data):
+        password_hash = user_data['password_hash'] if user_data else dummy_password_hash()
+        if bcrypt.check_password_hash(password_hash, form.password.data) and user_data:
             user = User(user_data['user_id'], user_data['username'], user_data['email'])
             login_user(user, remember=True)
             flash('Login successful!', 'success')
@@ -410,14 +495,14 @@ def logout():
 
 # --- Main App Routes ---
 
-@app.route('/')
-def homepage():
-    """Homepage shows Popular This Week based on review count."""
+@cache.memoize(timeout=60)
+def fetch_popular_works():
+    """Popular works for the homepage. Cached for a minute and cleared whenever a review is logged."""
     db = get_db()
     # Fetch popular works based on review count from the last 7 days
     popular_works = db.execute('''
         SELECT 
-            Work.*, 
+            Work.work_id, Work.title_kannada, Work.title_english, Work.cover_image_url,
             Author.name_kannada as author_kannada, 
             Author.name_english as author_english,
             Author.image_url as author_image_url,
@@ -436,78 +521,75 @@ def homepage():
     if len(popular_works) < 6:
         popular_works = db.execute('''
             SELECT 
-                Work.*, 
+                Work.work_id, Work.title_kannada, Work.title_english, Work.cover_image_url,
                 Author.name_kannada as author_kannada, 
                 Author.name_english as author_english,
                 Author.image_url as author_image_url,
-                COUNT(Review.review_id) as review_count,
-                AVG(Review.rating) as avg_rating
-            FROM Work
+                WorkStats.review_count,
+                WorkStats.sum_rating * 1.0 / WorkStats.review_count as avg_rating
+            FROM WorkStats
+            JOIN Work ON Work.work_id = WorkStats.work_id
             JOIN Author ON Work.author_id = Author.author_id
-            LEFT JOIN Review ON Work.work_id = Review.work_id
-            GROUP BY Work.work_id
-            HAVING review_count > 0
+            WHERE WorkStats.review_count > 0
             ORDER BY review_count DESC, avg_rating DESC
             LIMIT 12
         ''').fetchall()
     
-    return render_template('index.html', works=popular_works)
+    # sqlite3.Row can't be pickled into the cache, plain dicts can
+    return [dict(work) for work in popular_works]
+
+@app.route('/')
+def homepage():
+    """Homepage shows Popular This Week based on review count."""
+    return render_template('index.html', works=fetch_popular_works())
+
+REVIEWS_PER_PAGE = 50
+MAX_REVIEW_PAGE = 10**6  # Keeps the OFFSET within SQLite's 64-bit integers whatever ?page= says
+
+def review_page():
+    """The 1-based ?page= of a review list, and the OFFSET it starts at."""
+    page = min(max(request.args.get('page', 1, type=int), 1), MAX_REVIEW_PAGE)
+    return page, (page - 1) * REVIEWS_PER_PAGE
 
 @app.route('/work/<int:work_id>', methods=['GET', 'POST'])
 def work_details(work_id):
     """Shows details for a single work, its reviews, and the review form."""
     db = get_db()
-    work = db.execute('''
-        SELECT 
-            Work.*, 
-            Author.name_kannada as author_kannada, 
-            Author.name_english as author_english,
-            Author.image_url as author_image_url
-        FROM Work
-        JOIN Author ON Work.author_id = Author.author_id
-        WHERE Work.work_id = ?
-    ''', (work_id,)).fetchone()
-
-    if work is None:
-        abort(404)
-
-    reviews = db.execute('''
-        SELECT Review.*, User.username
-        FROM Review
-        JOIN User ON Review.user_id = User.user_id
-        WHERE Review.work_id = ?
-        ORDER BY Review.date_logged DESC
-    ''', (work_id,)).fetchall()
     
     # --- Review Form Logic ---
+    # Handled before the page queries: a successful submit just redirects
     form = ReviewForm()
     
     # Check for existing review (for update functionality)
     user_review = None
     if current_user.is_authenticated:
         user_review = db.execute(
-            'SELECT * FROM Review WHERE user_id = ? AND work_id = ?', 
+            'SELECT review_id, rating, review_text, date_read FROM Review WHERE user_id = ? AND work_id = ?', 
             (current_user.id, work_id)
         ).fetchone()
 
     if form.validate_on_submit() and current_user.is_authenticated:
+        if user_review is None and db.execute('SELECT 1 FROM Work WHERE work_id = ?', (work_id,)).fetchone() is None:
+            abort(404)
         try:
-            if user_review:
-                # Update existing review
-                db.execute('''
-                    UPDATE Review SET rating=?, review_text=?, date_read=?, date_logged=CURRENT_TIMESTAMP
-                    WHERE review_id = ?
-                ''', (form.rating.data, form.review_text.data, form.date_read.data, user_review['review_id']))
-                flash('Your review has been updated!', 'success')
-            else:
-                # Insert new review
-                db.execute('''
-                    INSERT INTO Review (user_id, work_id, rating, review_text, date_read)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (current_user.id, work_id, form.rating.data, form.review_text.data, form.date_read.data))
-                flash('Your review has been logged!', 'success')
-
-            db.commit()
+            with _WRITE_LOCK:
+                if user_review:
+                    # Update existing review
+                    db.execute('''
+                        UPDATE Review SET rating=?, review_text=?, date_read=?, date_logged=CURRENT_TIMESTAMP
+                        WHERE review_id = ?
+                    ''', (form.rating.data, form.review_text.data, form.date_read.data, user_review['review_id']))
+                    flash('Your review has been updated!', 'success')
+                else:
+                    # Insert new review
+                    db.execute('''
+                        INSERT INTO Review (user_id, work_id, rating, review_text, date_read)
+                        VALUES (?, ?, ?, ?, ?)
+                    ''', (current_user.id, work_id, form.rating.data, form.review_text.data, form.date_read.data))
+                    flash('Your review has been logged!', 'success')
+
+                db.commit()
+            cache.delete_memoized(fetch_popular_works)
             return redirect(url_for('work_details', work_id=work_id))
         except Exception as e:
             db.rollback()
@@ -520,179 +602,303 @@ def work_details(work_id):
             form.rating.data = user_review['rating']
             form.review_text.data = user_review['review_text']
             # Convert date string to date object
-            form.date_read.data = datetime.datetime.strptime(user_review['date_read'], '%Y-%m-%d').date()
+            form.date_read.data = datetime.date.fromisoformat(user_review['date_read'])
         else:
             # Default date read for new review
             form.date_read.data = datetime.date.today()
+    
+    work = db.execute('''
+        SELECT 
+            Work.work_id, Work.title_kannada, Work.title_english, Work.synopsis,
+            Author.name_kannada as author_kannada, 
+            Author.name_english as author_english,
+            Author.image_url as author_image_url
+        FROM Work
+        JOIN Author ON Work.author_id = Author.author_id
+        WHERE Work.work_id = ?
+    ''', (work_id,)).fetchone()
+
+    if work is None:
+        abort(404)
+
+    # One extra row tells us whether there is a next page, without a COUNT
+    page, offset = review_page()
+    reviews = db.execute('''
+        SELECT Review.rating, Review.review_text, Review.date_read, User.username
+        FROM Review
+        JOIN User ON Review.user_id = User.user_id
+        WHERE Review.work_id = ?
+        ORDER BY Review.date_logged DESC
+        LIMIT ? OFFSET ?
+    ''', (work_id, REVIEWS_PER_PAGE + 1, offset)).fetchall()
+    if page > 1 and not reviews:
+        abort(404)  # Past the last page
+    has_next = len(reviews) > REVIEWS_PER_PAGE
         
-    return render_template('work_details.html', work=work, reviews=reviews, form=form, user_review=user_review)
+    return render_template('work_details.html', work=work, reviews=reviews[:REVIEWS_PER_PAGE], form=form,
+                           user_review=user_review, page=page, has_next=has_next)
 
 @app.route('/profile/<string:username>')
 def user_profile(username):
-    """Shows a user's profile and all their reviews."""
+    """Shows a user's profile and their reviews, a page at a time."""
     db = get_db()
-    user = db.execute('SELECT * FROM User WHERE username = ?', (username,)).fetchone()
+    user = db.execute('SELECT user_id, username FROM User WHERE username = ?', (username,)).fetchone()
     
     if user is None:
         abort(404)
         
+    page, offset = review_page()
     reviews = db.execute('''
-        SELECT Review.*, Work.title_kannada, Work.title_english, Work.work_id
+        SELECT Review.rating, Review.review_text, Review.date_read, Work.title_kannada, Work.title_english, Work.work_id
         FROM Review
         JOIN Work ON Review.work_id = Work.work_id
         WHERE Review.user_id = ?
         ORDER BY Review.date_read DESC
-    ''', (user['user_id'],)).fetchall()
-    
-    return render_template('profile.html', user=user, reviews=reviews)
+        LIMIT ? OFFSET ?
+    ''', (user['user_id'], REVIEWS_PER_PAGE + 1, offset)).fetchall()
+    if page > 1 and not reviews:
+        abort(404)  # Past the last page
+    has_next = len(reviews) > REVIEWS_PER_PAGE
+    # The page only holds some of the reviews; the total is an index-only count
+    review_count = db.execute('SELECT COUNT(*) FROM Review WHERE user_id = ?', (user['user_id'],)).fetchone()[0]
+    
+    return render_template('profiles.html', user=user, reviews=reviews[:REVIEWS_PER_PAGE], review_count=review_count,
+                           page=page, has_next=has_next)
+
+@cache.memoize(timeout=60)
+def fetch_author(author_id):
+    """An author and their works, or None. Cached for a minute, which also bounds staleness after a reseed."""
+    db = get_db()
+    author = db.execute('SELECT * FROM Author WHERE author_id = ?', (author_id,)).fetchone()
+
+    if author is None:
+        return None
+
+    works = db.execute('''
+        SELECT work_id, title_kannada, title_english, type, cover_image_url
+        FROM Work WHERE author_id = ?
+    ''', (author_id,)).fetchall()
+
+    return dict(author), [dict(work) for work in works]
 
 @app.route('/author/<int:author_id>')
 def author_details(author_id):
     """Shows details for a single author and all their works."""
-    db = get_db()
-    author = db.execute('SELECT * FROM Author WHERE author_id = ?', (author_id,)).fetchone()
+    details = fetch_author(author_id)
 
-    if author is None:
+    if details is None:
         abort(404)
 
-    works = db.execute('SELECT * FROM Work WHERE author_id = ?', (author_id,)).fetchall()
-
+    author, works = details
     return render_template('author.html', author=author, works=works)
 
 
+# --- Full-text search helpers ---
+def fts_prefix_query(query):
+    """Turns free text into an FTS5 query that matches every word as a prefix."""
+    return ' '.join('"{}"*'.format(word.replace('"', '""')) for word in query.split())
+
+def fts_substring_query(query):
+    """Turns free text into a trigram-table query matching it anywhere (needs 3+ characters)."""
+    return '"{}"'.format(query.replace('"', '""'))
+
 # --- Auto-complete search ---
-@app.route('/search-autocomplete')
-def search_autocomplete():
-    query = request.args.get('q', '').strip().lower()
-    if not query or len(query) < 1:
-        return jsonify([])
-    
+AUTOCOMPLETE_CACHE_MAX_QUERY = 32  # Longer queries are rare; don't let them churn the cache
+# Entries are keyed on a time window, so after a reseed (run from another process,
+# which reassigns ids) the server serves stale suggestion URLs for at most this long
+AUTOCOMPLETE_CACHE_TTL = 60  # Seconds
+AUTOCOMPLETE_LIMIT = 10
+AUTOCOMPLETE_MAX_AUTHORS = 5  # Authors sort first; capping them leaves works room in the list
+
+@functools.lru_cache(maxsize=1024)
+def autocomplete_json(query, window):
+    """Serialized suggestions for a normalized query. Cached per `window`, which only keys the cache."""
     db = get_db()
     
-    # Fetch Authors (English or Kannada name contains query) - prioritize exact matches
-    authors_exact = db.execute(
-        '''SELECT author_id, name_kannada, name_english FROM Author 
-           WHERE LOWER(name_english) = ? OR LOWER(name_kannada) = ? LIMIT 3''', 
-        (query, query)
+    # Authors and works in one statement, from the full-text indexes: exact matches
+    # (priority 1) before names/titles with a word starting with the query (priority 2).
+    # Each kind is ranked and capped on its own, so authors can't crowd out every work
+    rows = db.execute(
+        '''SELECT * FROM (
+               SELECT 'Author' AS kind, Author.author_id AS id, Author.name_english AS en, Author.name_kannada AS kn,
+                      CASE WHEN Author.name_english = ?1 OR Author.name_kannada = ?1 THEN 1 ELSE 2 END AS priority,
+                      bm25(author_fts) AS rank
+               FROM author_fts JOIN Author ON Author.author_id = author_fts.rowid
+               WHERE author_fts MATCH ?2
+               ORDER BY priority, rank
+               LIMIT ?3)
+           UNION ALL
+           SELECT * FROM (
+               SELECT 'Work', Work.work_id, Work.title_english, Work.title_kannada,
+                      CASE WHEN Work.title_english = ?1 OR Work.title_kannada = ?1 THEN 1 ELSE 2 END AS priority,
+                      bm25(work_fts) AS rank
+               FROM work_fts JOIN Work ON Work.work_id = work_fts.rowid
+               WHERE work_fts MATCH ?2
+               ORDER BY priority, rank
+               LIMIT ?4)
+           ORDER BY priority, kind, rank
+           LIMIT ?4''',
+        (query, fts_prefix_query(query), AUTOCOMPLETE_MAX_AUTHORS, AUTOCOMPLETE_LIMIT)
     ).fetchall()
     
-    authors_partial = db.execute(
-        '''SELECT author_id, name_kannada, name_english FROM Author 
-           WHERE (LOWER(name_kannada) LIKE ? OR LOWER(name_english) LIKE ?)
-           AND author_id NOT IN (SELECT author_id FROM Author WHERE LOWER(name_english) = ? OR LOWER(name_kannada) = ?)
-           LIMIT 5''', 
-        (f'%{query}%', f'%{query}%', query, query)
-    ).fetchall()
+    # Only fall back to substring matches if word prefixes didn't fill the list
+    if len(rows) < AUTOCOMPLETE_LIMIT:
+        author_slots = AUTOCOMPLETE_MAX_AUTHORS - sum(row['kind'] == 'Author' for row in rows)
+        rows += db.execute(
+            '''SELECT * FROM (
+                   SELECT 'Author' AS kind, Author.author_id AS id, Author.name_english AS en,
+                          Author.name_kannada AS kn, 3 AS priority
+                   FROM author_trigram JOIN Author ON Author.author_id = author_trigram.rowid
+                   WHERE author_trigram MATCH ?1
+                     AND author_trigram.rowid NOT IN (SELECT rowid FROM author_fts WHERE author_fts MATCH ?2)
+                   LIMIT ?3)
+               UNION ALL
+               SELECT 'Work', Work.work_id, Work.title_english, Work.title_kannada, 3
+               FROM work_trigram JOIN Work ON Work.work_id = work_trigram.rowid
+               WHERE work_trigram MATCH ?1
+                 AND work_trigram.rowid NOT IN (SELECT rowid FROM work_fts WHERE work_fts MATCH ?2)
+               ORDER BY kind
+               LIMIT ?4''',
+            (fts_substring_query(query), fts_prefix_query(query), author_slots, AUTOCOMPLETE_LIMIT - len(rows))
+        ).fetchall()
+    
+    # Build each URL route once and append ids, rather than a full url_for per row
+    url_prefixes = {
+        'Author': url_for('author_details', author_id=0)[:-1],
+        'Work': url_for('work_details', work_id=0)[:-1],
+    }
+    suggestions = [{
+        'label': f"{row['kind']}: {row['en']} ({row['kn']})",
+        'type': row['kind'],
+        'url': f"{url_prefixes[row['kind']]}{row['id']}",
+        'priority': row['priority']
+    } for row in rows]
+    return dumps_bytes(suggestions)
+
+@app.route('/search-autocomplete')
+def search_autocomplete():
+    query = request.args.get('q', '').strip().lower()
+    # A single character matches most of the catalogue and the UI shows only 10 anyway
+    if len(query) < 2:
+        return jsonify([])
     
-    # Fetch Works (English or Kannada title contains query) - prioritize exact matches
-    works_exact = db.execute(
-        '''SELECT work_id, title_kannada, title_english FROM Work 
-           WHERE LOWER(title_english) = ? OR LOWER(title_kannada) = ? LIMIT 3''', 
-        (query, query)
-    ).fetchall()
+    if len(query) <= AUTOCOMPLETE_CACHE_MAX_QUERY:
+        body = autocomplete_json(query, int(time.monotonic() // AUTOCOMPLETE_CACHE_TTL))
+    else:
+        body = autocomplete_json.__wrapped__(query, None)
     
-    works_partial = db.execute(
-        '''SELECT work_id, title_kannada, title_english FROM Work 
-           WHERE (LOWER(title_kannada) LIKE ? OR LOWER(title_english) LIKE ?)
-           AND work_id NOT IN (SELECT work_id FROM Work WHERE LOWER(title_english) = ? OR LOWER(title_kannada) = ?)
-           LIMIT 7''', 
-        (f'%{query}%', f'%{query}%', query, query)
-    ).fetchall()
-
-    suggestions = []
-    
-    # Add exact matches first (higher priority)
-    for author in authors_exact:
-        suggestions.append({
-            'label': f"Author: {author['name_english']} ({author['name_kannada']})", 
-            'type': 'Author', 
-            'url': url_for('author_details', author_id=author['author_id']),
-            'priority': 1
-        })
-    
-    for work in works_exact:
-        suggestions.append({
-            'label': f"Work: {work['title_english']} ({work['title_kannada']})", 
-            'type': 'Work', 
-            'url': url_for('work_details', work_id=work['work_id']),
-            'priority': 1
-        })
-    
-    # Add partial matches
-    for author in authors_partial:
-        suggestions.append({
-            'label': f"Author: {author['name_english']} ({author['name_kannada']})", 
-            'type': 'Author', 
-            'url': url_for('author_details', author_id=author['author_id']),
-            'priority': 2
-        })
-    
-    for work in works_partial:
-        suggestions.append({
-            'label': f"Work: {work['title_english']} ({work['title_kannada']})", 
-            'type': 'Work', 
-            'url': url_for('work_details', work_id=work['work_id']),
-            'priority': 2
-        })
-    
-    # Sort by priority, then limit to 10 results
-    suggestions.sort(key=lambda x: x.get('priority', 3))
-    suggestions = suggestions[:10]
-        
-    return jsonify(suggestions)
+    # Let the browser reuse suggestions for a prefix it has just asked about
+    response = Response(body, mimetype='application/json')
+    response.headers['Cache-Control'] = 'public, max-age=30'
+    response.add_etag()
+    return response.make_conditional(request)
 
 # --- Search Results Page ---
-@app.route('/search')
-def search_results():
-    """Search results page showing all matching works and authors."""
-    query = request.args.get('q', '').strip()
-    
-    if not query:
-        return render_template('search_results.html', query='', works=[], authors=[])
-    
-    db = get_db()
-    
-    # Search for authors
+def search_authors(db, match, substring):
+    """Full-text prefix matches ranked by bm25; substring matches are added only when those are scarce."""
     authors = db.execute('''
-        SELECT author_id, name_kannada, name_english, biography, era, image_url
-        FROM Author 
-        WHERE LOWER(name_kannada) LIKE ? OR LOWER(name_english) LIKE ?
-        ORDER BY 
-            CASE 
-                WHEN LOWER(name_english) = ? OR LOWER(name_kannada) = ? THEN 1
-                WHEN LOWER(name_english) LIKE ? OR LOWER(name_kannada) LIKE ? THEN 2
-                ELSE 3
-            END,
-            name_english
+        SELECT Author.author_id, Author.name_kannada, Author.name_english,
+               Author.biography, Author.era, Author.image_url
+        FROM author_fts
+        JOIN Author ON Author.author_id = author_fts.rowid
+        WHERE author_fts MATCH ?
+        ORDER BY bm25(author_fts), Author.name_english
         LIMIT 20
-    ''', (f'%{query.lower()}%', f'%{query.lower()}%', query.lower(), query.lower(), f'{query.lower()}%', f'{query.lower()}%')).fetchall()
-    
-    # Search for works
+    ''', (match,)).fetchall()
+    
+    if len(authors) < 5:
+        authors += db.execute('''
+            SELECT Author.author_id, Author.name_kannada, Author.name_english,
+                   Author.biography, Author.era, Author.image_url
+            FROM author_trigram
+            JOIN Author ON Author.author_id = author_trigram.rowid
+            WHERE author_trigram MATCH ?
+              AND Author.author_id NOT IN (SELECT value FROM json_each(?))
+            ORDER BY Author.name_english
+            LIMIT ?
+        ''', (substring, json.dumps([a['author_id'] for a in authors]),
+              20 - len(authors))).fetchall()
+    return authors
+
+def search_works(db, match, substring):
+    """Title hits ranked by bm25, then works whose author matched; substring matches only when those are scarce."""
     works = db.execute('''
         SELECT 
-            Work.*,
+            Work.work_id, Work.title_kannada, Work.title_english, Work.cover_image_url,
             Author.name_kannada as author_kannada,
             Author.name_english as author_english,
             Author.image_url as author_image_url,
-            COUNT(Review.review_id) as review_count,
-            AVG(Review.rating) as avg_rating
-        FROM Work
+            COALESCE(WorkStats.review_count, 0) as review_count,
+            WorkStats.sum_rating * 1.0 / NULLIF(WorkStats.review_count, 0) as avg_rating
+        FROM (
+            SELECT work_id, MIN(rank) AS rank FROM (
+                SELECT rowid AS work_id, bm25(work_fts) AS rank
+                FROM work_fts WHERE work_fts MATCH ?
+                UNION ALL
+                SELECT Work.work_id, 0 AS rank
+                FROM author_fts JOIN Work ON Work.author_id = author_fts.rowid
+                WHERE author_fts MATCH ?
+            )
+            GROUP BY work_id
+        ) AS hits
+        JOIN Work ON Work.work_id = hits.work_id
         JOIN Author ON Work.author_id = Author.author_id
-        LEFT JOIN Review ON Work.work_id = Review.work_id
-        WHERE LOWER(Work.title_kannada) LIKE ? OR LOWER(Work.title_english) LIKE ?
-           OR LOWER(Author.name_english) LIKE ? OR LOWER(Author.name_kannada) LIKE ?
-        GROUP BY Work.work_id
-        ORDER BY 
-            CASE 
-                WHEN LOWER(Work.title_english) = ? OR LOWER(Work.title_kannada) = ? THEN 1
-                WHEN LOWER(Work.title_english) LIKE ? OR LOWER(Work.title_kannada) LIKE ? THEN 2
-                ELSE 3
-            END,
-            review_count DESC,
-            avg_rating DESC
+        LEFT JOIN WorkStats ON Work.work_id = WorkStats.work_id
+        ORDER BY hits.rank, review_count DESC, avg_rating DESC
         LIMIT 50
-    ''', (f'%{query.lower()}%', f'%{query.lower()}%', f'%{query.lower()}%', f'%{query.lower()}%',
-          query.lower(), query.lower(), f'{query.lower()}%', f'{query.lower()}%')).fetchall()
+    ''', (match, match)).fetchall()
+    
+    if len(works) < 5:
+        works += db.execute('''
+            SELECT 
+                Work.work_id, Work.title_kannada, Work.title_english, Work.cover_image_url,
+                Author.name_kannada as author_kannada,
+                Author.name_english as author_english,
+                Author.image_url as author_image_url,
+                COALESCE(WorkStats.review_count, 0) as review_count,
+                WorkStats.sum_rating * 1.0 / NULLIF(WorkStats.review_count, 0) as avg_rating
+            FROM (
+                SELECT rowid AS work_id FROM work_trigram WHERE work_trigram MATCH ?
+                UNION
+                SELECT Work.work_id
+                FROM author_trigram JOIN Work ON Work.author_id = author_trigram.rowid
+                WHERE author_trigram MATCH ?
+            ) AS hits
+            JOIN Work ON Work.work_id = hits.work_id
+            JOIN Author ON Work.author_id = Author.author_id
+            LEFT JOIN WorkStats ON Work.work_id = WorkStats.work_id
+            WHERE Work.work_id NOT IN (SELECT value FROM json_each(?))
+            ORDER BY review_count DESC, avg_rating DESC
+            LIMIT ?
+        ''', (substring, substring, json.dumps([w['work_id'] for w in works]),
+              50 - len(works))).fetchall()
+    return works
+
+def search_works_pooled(match, substring):
+    """Runs search_works on its own pooled connection, for use off the request thread."""
+    db = borrow_db()
+    try:
+        return search_works(db, match, substring)
+    finally:
+        release_db(db)
+
+# The author and work searches are independent, so /search runs them side by side
+_search_executor = ThreadPoolExecutor(max_workers=4)
+
+@app.route('/search')
+def search_results():
+    """Search results page showing all matching works and authors."""
+    query = request.args.get('q', '').strip()
+    
+    if not query:
+        return render_template('search_results.html', query='', works=[], authors=[])
+    
+    match = fts_prefix_query(query)
+    substring = fts_substring_query(query)
+    
+    works_future = _search_executor.submit(search_works_pooled, match, substring)
+    authors = search_authors(get_db(), match, substring)
+    works = works_future.result()
     
     return render_template('search_results.html', query=query, works=works, authors=authors)
 
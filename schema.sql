@@ -3,6 +3,11 @@ DROP TABLE IF EXISTS Author;
 DROP TABLE IF EXISTS Work;
 DROP TABLE IF EXISTS Review;
 DROP TABLE IF EXISTS Wishlist;
+DROP TABLE IF EXISTS WorkStats;
+DROP TABLE IF EXISTS author_fts;
+DROP TABLE IF EXISTS work_fts;
+DROP TABLE IF EXISTS author_trigram;
+DROP TABLE IF EXISTS work_trigram;
 
 CREATE TABLE User (
     user_id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -13,8 +18,8 @@ CREATE TABLE User (
 
 CREATE TABLE Author (
     author_id INTEGER PRIMARY KEY AUTOINCREMENT,
-    name_kannada TEXT NOT NULL,
-    name_english TEXT NOT NULL,
+    name_kannada TEXT NOT NULL COLLATE NOCASE,
+    name_english TEXT NOT NULL COLLATE NOCASE,
     biography TEXT,
     image_url TEXT, -- e.g., 'kuvempu.jpg'
     era TEXT
@@ -23,8 +28,8 @@ CREATE TABLE Author (
 CREATE TABLE Work (
     work_id INTEGER PRIMARY KEY AUTOINCREMENT,
     author_id INTEGER NOT NULL,
-    title_kannada TEXT NOT NULL,
-    title_english TEXT NOT NULL,
+    title_kannada TEXT NOT NULL COLLATE NOCASE,
+    title_english TEXT NOT NULL COLLATE NOCASE,
     synopsis TEXT,
     cover_image_url TEXT, -- e.g., 'kanooru_heggadithi.jpg'
     type TEXT, -- 'Novel', 'Poetry', 'Play'
@@ -50,4 +55,130 @@ CREATE TABLE Wishlist (
     FOREIGN KEY (user_id) REFERENCES User (user_id),
     FOREIGN KEY (work_id) REFERENCES Work (work_id),
     UNIQUE(user_id, work_id)
-);
\ No newline at end of file
+);
+
+-- Per-work review totals, maintained by the Review triggers below so list pages
+-- can read counts/averages without aggregating the whole Review table.
+CREATE TABLE WorkStats (
+    work_id INTEGER PRIMARY KEY,
+    review_count INTEGER NOT NULL DEFAULT 0,
+    sum_rating INTEGER NOT NULL DEFAULT 0,
+    FOREIGN KEY (work_id) REFERENCES Work (work_id)
+);
+
+CREATE TRIGGER work_stats_ai AFTER INSERT ON Review BEGIN
+    INSERT INTO WorkStats (work_id, review_count, sum_rating)
+    VALUES (new.work_id, 1, new.rating)
+    ON CONFLICT (work_id) DO UPDATE SET
+        review_count = review_count + 1,
+        sum_rating = sum_rating + excluded.sum_rating;
+END;
+
+CREATE TRIGGER work_stats_ad AFTER DELETE ON Review BEGIN
+    UPDATE WorkStats
+    SET review_count = review_count - 1, sum_rating = sum_rating - old.rating
+    WHERE work_id = old.work_id;
+END;
+
+CREATE TRIGGER work_stats_au AFTER UPDATE OF work_id, rating ON Review BEGIN
+    UPDATE WorkStats
+    SET review_count = review_count - 1, sum_rating = sum_rating - old.rating
+    WHERE work_id = old.work_id;
+    INSERT INTO WorkStats (work_id, review_count, sum_rating)
+    VALUES (new.work_id, 1, new.rating)
+    ON CONFLICT (work_id) DO UPDATE SET
+        review_count = review_count + 1,
+        sum_rating = sum_rating + excluded.sum_rating;
+END;
+
+-- English names/titles are unique (case-insensitively, like the columns), which
+-- is what populate_db's INSERT OR IGNORE relies on to deduplicate. Name/title
+-- lookups themselves go through the full-text tables below.
+CREATE UNIQUE INDEX idx_author_name_en ON Author (name_english COLLATE NOCASE);
+CREATE UNIQUE INDEX idx_work_title_en ON Work (title_english COLLATE NOCASE);
+
+-- Foreign-key lookups. idx_work_author also carries the columns work lists show,
+-- so listing an author's works never touches the Work rows (or their synopses).
+-- The Review indexes match the ORDER BY of the work and profile pages, so their
+-- reviews come back already sorted.
+CREATE INDEX idx_work_author ON Work (author_id, title_kannada, title_english, type, cover_image_url);
+CREATE INDEX idx_review_work ON Review (work_id, date_logged DESC);
+CREATE INDEX idx_review_user ON Review (user_id, date_read DESC);
+
+-- Full-text indexes for /search, kept in sync by the triggers below. The *_fts
+-- tables match whole words and word prefixes; their tokenizer also treats combining
+-- marks (M*) as part of a word, otherwise Kannada vowel signs would split every word.
+-- The *_trigram tables answer substring queries of three or more characters.
+CREATE VIRTUAL TABLE author_fts USING fts5(
+    name_kannada, name_english,
+    content='Author', content_rowid='author_id',
+    tokenize="unicode61 categories 'L* N* Co M*'"
+);
+
+CREATE VIRTUAL TABLE work_fts USING fts5(
+    title_kannada, title_english,
+    content='Work', content_rowid='work_id',
+    tokenize="unicode61 categories 'L* N* Co M*'"
+);
+
+CREATE VIRTUAL TABLE author_trigram USING fts5(
+    name_kannada, name_english,
+    content='Author', content_rowid='author_id',
+    tokenize='trigram'
+);
+
+CREATE VIRTUAL TABLE work_trigram USING fts5(
+    title_kannada, title_english,
+    content='Work', content_rowid='work_id',
+    tokenize='trigram'
+);
+
+CREATE TRIGGER author_search_ai AFTER INSERT ON Author BEGIN
+    INSERT INTO author_fts (rowid, name_kannada, name_english)
+    VALUES (new.author_id, new.name_kannada, new.name_english);
+    INSERT INTO author_trigram (rowid, name_kannada, name_english)
+    VALUES (new.author_id, new.name_kannada, new.name_english);
+END;
+
+CREATE TRIGGER author_search_ad AFTER DELETE ON Author BEGIN
+    INSERT INTO author_fts (author_fts, rowid, name_kannada, name_english)
+    VALUES ('delete', old.author_id, old.name_kannada, old.name_english);
+    INSERT INTO author_trigram (author_trigram, rowid, name_kannada, name_english)
+    VALUES ('delete', old.author_id, old.name_kannada, old.name_english);
+END;
+
+CREATE TRIGGER author_search_au AFTER UPDATE OF name_kannada, name_english ON Author BEGIN
+    INSERT INTO author_fts (author_fts, rowid, name_kannada, name_english)
+    VALUES ('delete', old.author_id, old.name_kannada, old.name_english);
+    INSERT INTO author_trigram (author_trigram, rowid, name_kannada, name_english)
+    VALUES ('delete', old.author_id, old.name_kannada, old.name_english);
+    INSERT INTO author_fts (rowid, name_kannada, name_english)
+    VALUES (new.author_id, new.name_kannada, new.name_english);
+    INSERT INTO author_trigram (rowid, name_kannada, name_english)
+    VALUES (new.author_id, new.name_kannada, new.name_english);
+END;
+
+CREATE TRIGGER work_search_ai AFTER INSERT ON Work BEGIN
+    INSERT INTO work_fts (rowid, title_kannada, title_english)
+    VALUES (new.work_id, new.title_kannada, new.title_english);
+    INSERT INTO work_trigram (rowid, title_kannada, title_english)
+    VALUES (new.work_id, new.title_kannada, new.title_english);
+END;
+
+CREATE TRIGGER work_search_ad AFTER DELETE ON Work BEGIN
+    INSERT INTO work_fts (work_fts, rowid, title_kannada, title_english)
+    VALUES ('delete', old.work_id, old.title_kannada, old.title_english);
+    INSERT INTO work_trigram (work_trigram, rowid, title_kannada, title_english)
+    VALUES ('delete', old.work_id, old.title_kannada, old.title_english);
+END;
+
+CREATE TRIGGER work_search_au AFTER UPDATE OF title_kannada, title_english ON Work BEGIN
+    INSERT INTO work_fts (work_fts, rowid, title_kannada, title_english)
+    VALUES ('delete', old.work_id, old.title_kannada, old.title_english);
+    INSERT INTO work_trigram (work_trigram, rowid, title_kannada, title_english)
+    VALUES ('delete', old.work_id, old.title_kannada, old.title_english);
+    INSERT INTO work_fts (rowid, title_kannada, title_english)
+    VALUES (new.work_id, new.title_kannada, new.title_english);
+    INSERT INTO work_trigram (rowid, title_kannada, title_english)
+    VALUES (new.work_id, new.title_kannada, new.title_english);
+END;
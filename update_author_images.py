@@ -8,29 +8,37 @@ import sqlite3
 
 DATABASE = 'kannada_letterboxd.db'
 
+# Author name_english -> image file in static/
+IMAGE_URLS = {
+    'Kuvempu': 'kuvempu.jpeg',
+    'Poornachandra Tejaswi': 'tejaswi.jpeg',
+}
+
 def update_author_images():
     """Update author records with image URLs."""
-    conn = sqlite3.connect(DATABASE)
+    conn = sqlite3.connect(DATABASE, isolation_level=None)  # Transactions are managed explicitly below
     cursor = conn.cursor()
     
+    # One UPDATE covers every author: a CASE picks each row's image
+    cases = ' '.join('WHEN ? THEN ?' for _ in IMAGE_URLS)
+    names = ', '.join('?' for _ in IMAGE_URLS)
+    params = [value for pair in IMAGE_URLS.items() for value in pair] + list(IMAGE_URLS)
+    
     try:
-        # Update Kuvempu
-        cursor.execute("UPDATE Author SET image_url = 'kuvempu.jpeg' WHERE name_english = 'Kuvempu'")
-        kuvempu_updated = cursor.rowcount
-        
-        # Update Poornachandra Tejaswi
-        cursor.execute("UPDATE Author SET image_url = 'tejaswi.jpeg' WHERE name_english = 'Poornachandra Tejaswi'")
-        tejaswi_updated = cursor.rowcount
-        
-        conn.commit()
+        # Take the write lock up front rather than upgrading a deferred transaction
+        cursor.execute('BEGIN IMMEDIATE')
+        cursor.execute(f"UPDATE Author SET image_url = CASE name_english {cases} END WHERE name_english IN ({names})",
+                       params)
+        updated = cursor.rowcount
+        cursor.execute('COMMIT')
         
-        print(f"✓ Updated {kuvempu_updated} record(s) for Kuvempu")
-        print(f"✓ Updated {tejaswi_updated} record(s) for Poornachandra Tejaswi")
+        print(f"✓ Updated {updated} author record(s): {', '.join(IMAGE_URLS)}")
         print("\n✓ Database updated successfully!")
         print("  Refresh your browser to see the author images on the homepage.")
         
     except Exception as e:
-        conn.rollback()
+        if conn.in_transaction:
+            cursor.execute('ROLLBACK')
         print(f"✗ Error updating database: {e}")
     finally:
         conn.close()
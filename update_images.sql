@@ -1,6 +1,8 @@
 -- SQL script to update author image URLs
 -- Run this in your SQLite database
 
-UPDATE Author SET image_url = 'kuvempu.jpeg' WHERE name_english = 'Kuvempu';
-UPDATE Author SET image_url = 'tejaswi.jpeg' WHERE name_english = 'Poornachandra Tejaswi';
-
+UPDATE Author SET image_url = CASE name_english
+    WHEN 'Kuvempu' THEN 'kuvempu.jpeg'
+    WHEN 'Poornachandra Tejaswi' THEN 'tejaswi.jpeg'
+END
+WHERE name_english IN ('Kuvempu', 'Poornachandra Tejaswi');